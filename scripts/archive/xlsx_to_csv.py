@@ -7,16 +7,54 @@ Transforms the Excel file in the data directory to CSV format.
 import os
 import sys
 import csv
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
 from python_calamine import CalamineWorkbook
 
-def convert_xlsx_to_csv(xlsx_path, output_dir=None):
+def convert_sheet(xlsx_path, sheet_index, sheet_name, output_dir):
+    """
+    Convert a single sheet of an XLSX file to CSV.
+    
+    Opens its own workbook handle so it can run in a worker process.
+    
+    Returns:
+        Tuple of (csv_path, number of rows written)
+    """
+    workbook = CalamineWorkbook.from_path(str(xlsx_path))
+    sheet = workbook.get_sheet_by_index(sheet_index)
+    
+    # Generate output CSV filename
+    # Sanitize sheet name for filename
+    safe_sheet_name = "".join(c for c in sheet_name if c.isalnum() or c in (' ', '-', '_')).strip()
+    safe_sheet_name = safe_sheet_name.replace(' ', '_')
+    
+    csv_filename = f"{xlsx_path.stem}_{safe_sheet_name}.csv"
+    csv_path = output_dir / csv_filename
+    
+    # Stream rows from the sheet straight into the CSV, skipping the empty
+    # rows above the first used cell as to_python() does
+    first_row = sheet.start[0] if sheet.start else 0
+    num_rows = 0
+    with open(csv_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        for row in islice(sheet.iter_rows(), first_row, None):
+            writer.writerow(row)
+            num_rows += 1
+    
+    return csv_path, num_rows
+
+def convert_xlsx_to_csv(xlsx_path, output_dir=None, sheets=None):
     """
     Convert XLSX file to CSV files (one per sheet).
     
+    Sheets are converted in parallel, one worker process per sheet.
+    
     Args:
         xlsx_path: Path to the input XLSX file
         output_dir: Directory to save CSV files (default: same as XLSX file)
+        sheets: Optional list of sheet names to convert (default: all sheets)
     """
     xlsx_path = Path(xlsx_path)
     
@@ -38,36 +76,40 @@ def convert_xlsx_to_csv(xlsx_path, output_dir=None):
     num_sheets = workbook.sheet_names
     print(f"Found {len(num_sheets)} sheet(s): {', '.join(num_sheets)}")
     
+    # Apply the optional sheet name filter
+    selected = list(enumerate(num_sheets))
+    if sheets is not None:
+        missing = set(sheets) - set(num_sheets)
+        if missing:
+            print(f"Warning: sheet(s) not found: {', '.join(sorted(missing))}")
+        selected = [(i, name) for i, name in selected if name in sheets]
+    
+    if not selected:
+        print("No sheets to convert")
+        return
+    
     # Convert each sheet to CSV
-    for sheet_index, sheet_name in enumerate(num_sheets):
-        print(f"\nProcessing sheet {sheet_index + 1}: {sheet_name}")
-        
-        # Get the sheet
-        sheet = workbook.get_sheet_by_index(sheet_index)
-        
-        # Generate output CSV filename
-        # Sanitize sheet name for filename
-        safe_sheet_name = "".join(c for c in sheet_name if c.isalnum() or c in (' ', '-', '_')).strip()
-        safe_sheet_name = safe_sheet_name.replace(' ', '_')
-        
-        csv_filename = f"{xlsx_path.stem}_{safe_sheet_name}.csv"
-        csv_path = output_dir / csv_filename
-        
-        # Read all data from the sheet
-        data = sheet.to_python()
-        
-        # Write to CSV
-        print(f"Writing to: {csv_path}")
-        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerows(data)
-        
-        print(f"✓ Converted {len(data)} rows to {csv_path}")
+    max_workers = min(len(selected), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(convert_sheet, xlsx_path, sheet_index, sheet_name, output_dir): sheet_name
+            for sheet_index, sheet_name in selected
+        }
+        for future in as_completed(futures):
+            csv_path, num_rows = future.result()
+            print(f"✓ Converted {futures[future]}: {num_rows} rows to {csv_path}")
     
     print(f"\n✓ Conversion complete! CSV files saved to: {output_dir}")
 
 def main():
     """Main function to run the conversion."""
+    parser = argparse.ArgumentParser(description="Convert the data directory XLSX file to CSV")
+    parser.add_argument(
+        '--sheets', nargs='+', metavar='NAME',
+        help="Only convert the named sheets (default: all sheets)"
+    )
+    args = parser.parse_args()
+    
     # Get the script directory and project root
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
@@ -87,7 +129,7 @@ def main():
     output_dir = data_dir
     
     try:
-        convert_xlsx_to_csv(xlsx_file, output_dir)
+        convert_xlsx_to_csv(xlsx_file, output_dir, sheets=args.sheets)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -12,6 +12,11 @@ import time
 from pathlib import Path
 from collections import defaultdict
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
 def parse_formula_references(formula: str, target_column: str) -> list:
     """
     Parse formula to extract child row references.
@@ -144,12 +149,17 @@ def build_tree_from_relationships(parent_to_children: dict, root_rows: list) ->
 
 def save_row_hierarchy(hierarchy: dict, output_path: Path):
     """Save row hierarchy to JSON."""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump({
-            'hierarchy_tree': hierarchy['hierarchy_tree'],
-            'all_rows_involved': hierarchy['all_rows_involved'],
-            'stats': hierarchy['stats']
-        }, f, indent=2, ensure_ascii=False)
+    output = {
+        'hierarchy_tree': hierarchy['hierarchy_tree'],
+        'all_rows_involved': hierarchy['all_rows_involved'],
+        'stats': hierarchy['stats']
+    }
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
     
     print(f"\n✓ Row hierarchy saved to: {output_path}")
 
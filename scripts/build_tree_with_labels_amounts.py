@@ -4,12 +4,18 @@ Uses Polars for speed and multiprocessing for parallel processing.
 """
 import json
 import polars as pl
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 from functools import partial
-from typing import Dict, List, Any
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Any
 import re
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder/decoder
+    orjson = None
+
 
 def parse_amount(amount_str: str) -> float:
     """Parse amount string to float, handling commas and whitespace."""
@@ -37,7 +43,14 @@ def get_deepest_label(row: Dict[str, Any]) -> str:
     return ""
 
 
-def process_batch(rows_data: List[Dict], chunk_info: Dict) -> Dict[int, Dict]:
+def chunks(items: Iterable, size: int) -> Iterator[List]:
+    """Yield successive lists of at most `size` items."""
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def process_batch(rows_data: List[Dict]) -> Dict[int, Dict]:
     """
     Process a batch of rows to extract labels and amounts.
     Returns a dictionary mapping row number (1-indexed) to {label, amount}.
@@ -59,7 +72,7 @@ def process_batch(rows_data: List[Dict], chunk_info: Dict) -> Dict[int, Dict]:
     return result
 
 
-def load_csv_with_polars(csv_path: str, batch_size: int = 50000) -> Dict[int, Dict]:
+def load_csv_with_polars(csv_path: str, batch_size: int = 1000) -> Dict[int, Dict]:
     """
     Load CSV using Polars and extract labels/amounts in batches with multiprocessing.
     Returns dictionary mapping row number (1-indexed) to {label, amount}.
@@ -103,26 +116,11 @@ def load_csv_with_polars(csv_path: str, batch_size: int = 50000) -> Dict[int, Di
     print(f"Processing in {num_batches} batches of size ~{batch_size}...")
 
     with ProcessPoolExecutor(max_workers=None) as executor:
-        futures = []
-
-        for batch_idx in range(num_batches):
-            start = batch_idx * batch_size
-            end = min((batch_idx + 1) * batch_size, len(rows_data))
-            batch = rows_data[start:end]
-
-            chunk_info = {
-                'batch_idx': batch_idx,
-                'start': start,
-                'end': end,
-                'total_rows': len(rows_data)
-            }
-
-            future = executor.submit(process_batch, batch, chunk_info)
-            futures.append(future)
-
-        # Collect results
-        for future in as_completed(futures):
-            batch_result = future.result()
+        # Small batches handed out several at a time keep workers evenly
+        # loaded without paying one future per batch
+        for batch_result in executor.map(
+            process_batch, chunks(rows_data, batch_size), chunksize=8
+        ):
             row_data.update(batch_result)
             if len(row_data) % 10000 == 0:
                 print(f"Processed {len(row_data)} rows...")
@@ -141,17 +139,21 @@ def build_tree_from_hierarchy(
     """
     def build_node(node: Dict[str, Any]) -> Dict[str, Any] | None:
         row_num = node['row']
-        data = row_data.get(row_num, {})
-        label = data.get('label', '')
+        data = row_data.get(row_num)
+        if data is None:
+            return None
 
         # Filter out nodes with empty labels
+        label = data['label']
         if not label or not str(label).strip():
             return None
 
+        # Every node carries 'children' (possibly empty) so consumers can
+        # index it directly
         result = {
             'row': row_num,
             'label': label,
-            'amount': data.get('amount', 0.0),
+            'amount': data['amount'],
             'children': []
         }
 
@@ -178,8 +180,12 @@ def build_tree_from_hierarchy(
 def save_tree(tree: Dict[str, Any], output_path: str):
     """Save tree structure to JSON file."""
     print(f"Saving tree to {output_path}...")
-    with open(output_path, 'w') as f:
-        json.dump(tree, f, indent=2)
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(tree, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(tree, f, indent=2)
     print(f"Tree saved successfully!")
 
 
@@ -194,25 +200,24 @@ def calculate_tree_stats(tree: Dict[str, Any]) -> Dict[str, Any]:
     }
 
     def count_nodes(node: Dict[str, Any], is_leaf: bool = False):
+        amount = node['amount']
         stats['total_nodes'] += 1
-        stats['total_amount'] += node.get('amount', 0.0)
+        stats['total_amount'] += amount
 
         # All nodes should have labels now (filtered out empties)
         stats['nodes_with_labels'] += 1
 
-        if node.get('amount', 0.0) != 0.0:
+        if amount != 0.0:
             stats['nodes_with_amounts'] += 1
 
         if is_leaf:
             stats['leaf_nodes'] += 1
 
-        for child in node.get('children', []):
-            is_child_leaf = len(child.get('children', [])) == 0
-            count_nodes(child, is_child_leaf)
+        for child in node['children']:
+            count_nodes(child, not child['children'])
 
-    for root in tree.get('hierarchy_tree', []):
-        is_root_leaf = len(root.get('children', [])) == 0
-        count_nodes(root, is_root_leaf)
+    for root in tree['hierarchy_tree']:
+        count_nodes(root, not root['children'])
 
     return stats
 
@@ -232,13 +237,16 @@ def main():
 
     # Step 1: Load row hierarchy
     print("\nStep 1: Loading row hierarchy...")
-    with open(hierarchy_path, 'r') as f:
-        hierarchy = json.load(f)
+    if orjson is not None:
+        hierarchy = orjson.loads(hierarchy_path.read_bytes())
+    else:
+        with open(hierarchy_path, 'r') as f:
+            hierarchy = json.load(f)
     print(f"Loaded hierarchy with {len(hierarchy['hierarchy_tree'])} root nodes")
 
     # Step 2: Load CSV and extract labels/amounts
     print("\nStep 2: Loading CSV and extracting labels/amounts...")
-    row_data = load_csv_with_polars(str(csv_path), batch_size=50000)
+    row_data = load_csv_with_polars(str(csv_path), batch_size=1000)
 
     # Step 3: Build tree
     print("\nStep 3: Building tree from hierarchy...")
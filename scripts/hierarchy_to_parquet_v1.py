@@ -6,46 +6,96 @@ Uses hierarchical_tree_with_labels_and_amounts.json as input.
 """
 
 import json
+import os
+import pickle
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib decoder
+    orjson = None
 
 def load_json(json_path: Path) -> List[Dict]:
-    """Load hierarchical JSON."""
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-        # The new JSON structure has 'hierarchy_tree' as the root key
-        return data.get('hierarchy_tree', [])
+    """
+    Load hierarchical JSON.
+    
+    The decoded tree is cached next to the JSON file as a pickle and reused
+    while the JSON's mtime and size match the ones recorded with it. Within a
+    process, repeated calls for an unchanged file return the same (shared,
+    not copied) list.
+    """
+    stat = json_path.stat()
+    return _load_json_cached(json_path, (stat.st_mtime_ns, stat.st_size))
 
-def looks_like_amount(value: str) -> bool:
-    """Check if a string looks like an amount."""
-    if not value:
-        return False
-    value = value.strip().replace(',', '').replace('₱', '').replace('PHP', '')
+@lru_cache(maxsize=4)
+def _load_json_cached(json_path: Path, source_sig: Tuple[int, int]) -> List[Dict]:
+    """Load hierarchical JSON; keyed on (mtime_ns, size) so edits invalidate the entry."""
+    cache_path = json_path.with_suffix('.pkl')
     try:
-        float(value)
-        return True
-    except ValueError:
-        return False
+        with open(cache_path, 'rb') as f:
+            cached_sig, nodes = pickle.load(f)
+        if cached_sig == source_sig:
+            return nodes
+    except Exception:
+        # Missing, corrupt or old-format cache: fall back to the JSON
+        pass
+    
+    if orjson is not None:
+        data = orjson.loads(json_path.read_bytes())
+    else:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    # The new JSON structure has 'hierarchy_tree' as the root key
+    nodes = data.get('hierarchy_tree', [])
+    
+    # Writing the cache is best-effort (e.g. read-only checkouts). Write to a
+    # per-process temp file and rename it into place so an interrupted or
+    # concurrent run never leaves a truncated cache behind.
+    tmp_path = cache_path.with_suffix(f'.pkl.{os.getpid()}.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((source_sig, nodes), f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+    return nodes
 
-def find_leaves_and_paths(nodes: List[Dict]) -> List[Dict]:
+def find_leaves_and_paths(nodes: List[Dict]) -> Tuple[List[Dict], Dict[str, Any]]:
     """
     Recursively find all leaf nodes and build their full paths.
     
-    Returns list of dictionaries with path and amount information.
+    Returns list of dictionaries with path and amount information, plus
+    summary statistics (total amount, rows with amount, depth distribution)
+    accumulated during the same traversal.
     """
     results = []
+    stats = {
+        'total_amount': 0.0,
+        'rows_with_amount': 0,
+        'depth_dist': {}
+    }
+    # Share one string object per distinct label so the level_* columns
+    # reuse ancestor strings instead of holding a copy per leaf
+    intern_cache = {}
     
     def traverse(node: Dict, current_path: List[str]):
         """Recursively traverse nodes to find leaves."""
-        children = node.get('children', [])
-        label = node.get('label', '').strip()
-        amount = node.get('amount')
-        row = node.get('row')
+        children = node['children']
+        label = node['label'].strip()
+        label = intern_cache.setdefault(label, label)
+        amount = node['amount']
+        row = node['row']
         description = node.get('description', '')
 
         if not children:
             # This is a leaf node
             path = current_path + [label]
+            depth = len(path)
             results.append({
                 'path': ' > '.join(path),
                 'level_0': '.',
@@ -64,8 +114,13 @@ def find_leaves_and_paths(nodes: List[Dict]) -> List[Dict]:
                 'row': row,
                 'description': description,
                 'amount': amount,
-                'depth': len(path)
+                'depth': depth
             })
+
+            if amount is not None:
+                stats['total_amount'] += amount
+                stats['rows_with_amount'] += 1
+            stats['depth_dist'][depth] = stats['depth_dist'].get(depth, 0) + 1
         else:
             # Recurse into children
             for child in children:
@@ -75,7 +130,7 @@ def find_leaves_and_paths(nodes: List[Dict]) -> List[Dict]:
     for node in nodes:
         traverse(node, [])
     
-    return results
+    return results, stats
 
 def main():
     """Main function."""
@@ -94,18 +149,12 @@ def main():
     
     # Find all leaves
     print("\nFinding leaf nodes...")
-    leaf_rows = find_leaves_and_paths(root_nodes)
+    leaf_rows, stats = find_leaves_and_paths(root_nodes)
     print(f"Found {len(leaf_rows):,} leaf nodes")
     
-    # Calculate statistics
-    total_amount = sum(row['amount'] for row in leaf_rows if row['amount'] is not None)
-    rows_with_amount = sum(1 for row in leaf_rows if row['amount'] is not None)
-    
-    # Depth distribution
-    depth_dist = {}
-    for row in leaf_rows:
-        depth = row['depth']
-        depth_dist[depth] = depth_dist.get(depth, 0) + 1
+    total_amount = stats['total_amount']
+    rows_with_amount = stats['rows_with_amount']
+    depth_dist = stats['depth_dist']
     
     # Print summary
     print("\n" + "=" * 80)
@@ -141,65 +190,49 @@ def main():
     print(f"Saving to Parquet: {parquet_file}")
     
     try:
-        import pyarrow as pa
-        import pyarrow.parquet as pq
+        import polars as pl
         
-        # Convert to PyArrow table
-        table = pa.table({
-            'level_0': [row['level_0'] for row in leaf_rows],
-            'level_1': [row['level_1'] for row in leaf_rows],
-            'level_2': [row['level_2'] for row in leaf_rows],
-            'level_3': [row['level_3'] for row in leaf_rows],
-            'level_4': [row['level_4'] for row in leaf_rows],
-            'level_5': [row['level_5'] for row in leaf_rows],
-            'level_6': [row['level_6'] for row in leaf_rows],
-            'level_7': [row['level_7'] for row in leaf_rows],
-            'level_8': [row['level_8'] for row in leaf_rows],
-            'level_9': [row['level_9'] for row in leaf_rows],
-            'level_10': [row['level_10'] for row in leaf_rows],
-            'level_11': [row['level_11'] for row in leaf_rows],
-            'label': [row['label'] for row in leaf_rows],
-            'row': [row['row'] for row in leaf_rows],
-            'description': [row['description'] for row in leaf_rows],
-            'amount': [float(row['amount']) if row['amount'] is not None else None for row in leaf_rows],
-            'depth': [row['depth'] for row in leaf_rows],
-            'path': [row['path'] for row in leaf_rows]
+        # Build the frame in a single pass over the leaf rows
+        level_schema = {f'level_{i}': pl.Utf8 for i in range(12)}
+        df = pl.from_dicts(leaf_rows, schema={
+            **level_schema,
+            'label': pl.Utf8,
+            'row': pl.Int64,
+            'description': pl.Utf8,
+            'amount': pl.Float64,
+            'depth': pl.Int32,
+            'path': pl.Utf8
         })
         
         # Write to Parquet
-        pq.write_table(table, parquet_file)
+        df.write_parquet(parquet_file, compression="zstd", statistics=True)
         
         print(f"✓ Saved {len(leaf_rows):,} rows to Parquet file")
         print(f"  File size: {parquet_file.stat().st_size / (1024 * 1024):.2f} MB")
         
     except ImportError as e:
-        print(f"\n⚠️  PyArrow not installed. Installing...")
+        print(f"\n⚠️  Polars not installed. Installing...")
         import subprocess
-        subprocess.run(['pip', 'install', 'pyarrow', 'pyarrow-parquet'], check=True)
-        print("✓ PyArrow installed. Please run script again.")
+        subprocess.run(['pip', 'install', 'polars'], check=True)
+        print("✓ Polars installed. Please run script again.")
         return
     
     except Exception as e:
         print(f"\n❌ Error saving to Parquet: {e}")
         return
     
-    # Also save to CSV for compatibility
+    # Also save to CSV for compatibility, streamed from the Parquet file.
+    # Polars quotes empty strings ("") to tell them apart from nulls, so
+    # blank text fields are turned into nulls to keep them as bare empty
+    # fields; rows end in CRLF like the previous csv.DictWriter output.
     csv_file = data_dir / "hierarchical_tree_leaf_nodes.csv"
     print(f"\nAlso saving to CSV: {csv_file}")
     
-    import csv as csv_module
-    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = [
-            'level_0', 'level_1', 'level_2', 'level_3', 'level_4',
-            'level_5', 'level_6', 'level_7', 'level_8', 'level_9', 'level_10', 'level_11',
-            'label', 'row', 'description', 'amount', 'depth', 'path'
-        ]
-        writer = csv_module.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in leaf_rows:
-            # Clean up None values for CSV
-            csv_row = {k: (v if v is not None else '') for k, v in row.items()}
-            writer.writerow(csv_row)
+    (
+        pl.scan_parquet(parquet_file)
+        .with_columns(pl.col(pl.Utf8).replace('', None))
+        .sink_csv(csv_file, line_terminator='\r\n')
+    )
     
     print(f"✓ Saved {len(leaf_rows):,} rows to CSV file")
     
@@ -1,6 +1,11 @@
 import pyarrow.parquet as pq
 import json
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
 parquet_path = '/home/temp/_CODE/DPWH_2026_GAA/data/hierarchical_tree_leaf_nodes.parquet'
 output_path = '/home/temp/_CODE/DPWH_2026_GAA/data/leaf_nodes.json'
 
@@ -10,8 +15,13 @@ table = pq.read_table(parquet_path)
 print('Converting to dictionary...')
 data = table.to_pydict()
 
+# Compact output: the file is only fetched and parsed by tables/index.html
 print(f'Writing {len(next(iter(data.values())))} records to JSON...')
-with open(output_path, 'w') as f:
-    json.dump(data, f, indent=2)
+if orjson is not None:
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(data))
+else:
+    with open(output_path, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
 
 print('Done!')